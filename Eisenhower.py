@@ -1,8 +1,21 @@
 import os
 import sys
 import json
+import hashlib
+import bisect
+import itertools
+import threading
+import functools
+import weakref
+import uuid
+from collections import OrderedDict
 from datetime import datetime
 
+try:
+    import orjson  # optional: much faster parse/serialize for the JSON stores
+except ImportError:
+    orjson = None
+
 # ---------------- QtCore ---------------- #
 from PySide6.QtCore import (
     Qt,
@@ -10,6 +23,15 @@ from PySide6.QtCore import (
     QPoint,
     QSize,
     QDate,
+    QTimer,
+    QUrl,
+    QObject,
+    QMetaObject,
+    Q_ARG,
+    Signal,
+    QThreadPool,
+    QModelIndex,
+    QAbstractListModel,
     QAbstractTableModel,
     QSortFilterProxyModel,
 )
@@ -20,13 +42,18 @@ from PySide6.QtGui import (
     QIcon,
     QPalette,
     QColor,
-    QTextCursor,
     QTextCharFormat,
     QTextDocument,
+    QTextDocumentFragment,
     QTextListFormat,
     QFont,
+    QFontMetrics,
+    QPainter,
+    QPixmapCache,
     QPixmap,
     QImage,
+    QImageReader,
+    QImageWriter,
     QTextImageFormat,
 )
 
@@ -40,6 +67,10 @@ from PySide6.QtWidgets import (
     QPushButton,
     QListWidget,
     QListWidgetItem,
+    QListView,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QStyle,
     QLabel,
     QLineEdit,
     QDateEdit,
@@ -50,9 +81,9 @@ from PySide6.QtWidgets import (
     QFormLayout,
     QComboBox,
     QTextEdit,
+    QPlainTextEdit,
     QMessageBox,
     QFrame,
-    QSizePolicy,
     QFileDialog,
     QTabWidget,
     QGraphicsView,
@@ -84,12 +115,106 @@ if not os.path.exists(APP_DIR):
     os.makedirs(APP_DIR)
 
 DATA_FILE = os.path.join(APP_DIR, "tasks.json")
-NOTES_FILE = os.path.join(APP_DIR, "notes.json")
+NOTES_FILE = os.path.join(APP_DIR, "notes.json")  # legacy single file, migrated on load
+NOTES_INDEX_FILE = os.path.join(APP_DIR, "notes_index.json")
+NOTES_DIR = os.path.join(APP_DIR, "notes")
 TOPICS_FILE = os.path.join(APP_DIR, "topics.json")
 
+CATEGORIES = ("do", "plan", "delegate", "wait")
+VALID_CATEGORIES = frozenset(CATEGORIES)
+CATEGORY_ALIASES = {"ask": "delegate"}  # legacy names
+
+
+def normalize_category(cat):
+    """Stored category for any raw value; unknown or empty becomes "plan"."""
+    cat = (cat or "").strip().lower()
+    cat = CATEGORY_ALIASES.get(cat, cat)
+    return cat if cat in VALID_CATEGORIES else "plan"
+
+# Shared formatting objects, allocated once instead of per dialog/row
+TODAY_FORMAT = QTextCharFormat()
+TODAY_FORMAT.setBackground(QColor("yellow"))
+
+SEARCH_HIGHLIGHT_FORMAT = QTextCharFormat()
+SEARCH_HIGHLIGHT_FORMAT.setBackground(QColor("#ffff66"))
+
+OVERDUE_COLOR = QColor("red")
+DUE_SOON_COLOR = QColor("#e67e22")  # orange
+DEFAULT_TEXT_COLOR = QColor("black")
+
+def json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def json_dumps(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=4096)
+def format_iso_date(iso):
+    """ISO date/timestamp as dd.MM.yyyy; None if it does not parse."""
+    # Fast path for the yyyy-mm-dd[T...] shape this app writes
+    if (
+        len(iso) >= 10 and iso[4] == "-" and iso[7] == "-"
+        and iso[:4].isdigit() and iso[5:7].isdigit() and iso[8:10].isdigit()
+        and (len(iso) == 10 or iso[10] in "T ")
+    ):
+        return f"{iso[8:10]}.{iso[5:7]}.{iso[:4]}"
+    try:
+        return datetime.fromisoformat(iso).strftime("%d.%m.%Y")
+    except Exception:
+        return None
+
+
+def write_file_atomic(path, data: bytes):
+    # Write to a temp file first so a crash never leaves a truncated file
+    tmp_file = path + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+    os.replace(tmp_file, path)
+
 # ---------------------- Data model ---------------------- #
 
+# Every persisted-field assignment takes a fresh number, so render caches
+# keyed on (id(task), revision) never serve stale or recycled entries
+_task_revisions = itertools.count()
+
+
 class Task:
+    # Persisted fields; assigning any of them drops the cached to_dict() and sort_key
+    FIELDS = frozenset({
+        "title",
+        "category",
+        "due_date",
+        "status",
+        "created_at",
+        "completed_at",
+        "closing_comment",
+        "description",
+    })
+
+    __slots__ = (
+        "title",
+        "category",
+        "_due_date",
+        "status",
+        "created_at",
+        "_completed_at",
+        "closing_comment",
+        "_description",
+        "original_category",
+        "_due_qdate",
+        "_due_display",
+        "_description_flat",
+        "_completed_display",
+        "_sort_key",
+        "_dict_cache",
+        "_revision",
+    )
+
     def __init__(
         self,
         title,
@@ -101,32 +226,138 @@ class Task:
         closing_comment=None,
         description=None,
     ):
+        self._dict_cache = None
+        self.original_category = None
         self.title = title
         self.category = category
         self.due_date = due_date  # stored as "yyyy-MM-dd"
         self.status = status
-        self.created_at = created_at or datetime.now().isoformat()
+        self.created_at = created_at  # stamped by TaskManager.add_task
         self.completed_at = completed_at
         self.closing_comment = closing_comment
         self.description = description
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in Task.FIELDS:
+            object.__setattr__(self, "_dict_cache", None)
+            object.__setattr__(self, "_sort_key", None)
+            object.__setattr__(self, "_revision", next(_task_revisions))
+
+    # ---------------------- Due date cache ---------------------- #
+    @property
+    def due_date(self):
+        return self._due_date
+
+    @due_date.setter
+    def due_date(self, value):
+        self._due_date = value
+        self._invalidate_due_cache()
+
+    def _invalidate_due_cache(self):
+        self._due_qdate = None
+        self._due_display = None
+
+    @property
+    def due_qdate(self):
+        """Parsed due date (invalid QDate if missing/unparsable)."""
+        if self._due_qdate is None:
+            if self._due_date:
+                self._due_qdate = QDate.fromString(self._due_date, "yyyy-MM-dd")
+            else:
+                self._due_qdate = QDate()
+        return self._due_qdate
+
+    @property
+    def due_display(self):
+        """Due date formatted as dd.MM.yyyy for list rows."""
+        if self._due_display is None:
+            if not self._due_date:
+                self._due_display = "(no date)"
+            elif self.due_qdate.isValid():
+                self._due_display = self.due_qdate.toString("dd.MM.yyyy")
+            else:
+                self._due_display = self._due_date
+        return self._due_display
+
+    # ---------------------- Completion date cache ---------------------- #
+    @property
+    def completed_at(self):
+        return self._completed_at
+
+    @completed_at.setter
+    def completed_at(self, value):
+        self._completed_at = value
+        self._completed_display = None
+
+    @property
+    def completed_display(self):
+        """Completion date formatted as dd.MM.yyyy for the archive."""
+        if self._completed_display is None:
+            if not self._completed_at:
+                self._completed_display = ""
+            else:
+                self._completed_display = (
+                    format_iso_date(self._completed_at) or self._completed_at.split("T")[0]
+                )
+        return self._completed_display
+
+    # ---------------------- Description cache ---------------------- #
+    @property
+    def description(self):
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+        self._description_flat = None
+
+    @property
+    def description_flat(self):
+        """Description on a single line, for list rows."""
+        if self._description_flat is None:
+            self._description_flat = (self._description or "").replace("\n", " ").strip()
+        return self._description_flat
+
+    @property
+    def sort_key(self):
+        """Matrix order: due date ascending (undated last), then created, title."""
+        if self._sort_key is None:
+            d = self.due_qdate
+            created = datetime.min
+            if isinstance(self.created_at, str):
+                try:
+                    created = datetime.fromisoformat(self.created_at)
+                except Exception:
+                    pass
+            self._sort_key = (
+                not d.isValid(),                        # dated first (False < True)
+                d.toJulianDay() if d.isValid() else 0,  # actual due date
+                created,                                # tie-breaker
+                self.title or "",                       # final deterministic tie-breaker
+            )
+        return self._sort_key
+
     def to_dict(self):
-        return {
-            "title": self.title,
-            "category": self.category,
-            "due_date": self.due_date,
-            "status": self.status,
-            "created_at": self.created_at,
-            "completed_at": self.completed_at,
-            "closing_comment": self.closing_comment,
-            "description": self.description,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "title": self.title,
+                "category": self.category,
+                "due_date": self.due_date,
+                "status": self.status,
+                "created_at": self.created_at,
+                "completed_at": self.completed_at,
+                "closing_comment": self.closing_comment,
+                "description": self.description,
+            }
+        return self._dict_cache
 
     @staticmethod
     def from_dict(d):
+        # Normalize once on load; the stored form is the normalized form
         return Task(
             title=d["title"],
-            category=d.get("category", "plan"),
+            category=normalize_category(d.get("category")),
             due_date=d.get("due_date"),
             status=d.get("status", "open"),
             created_at=d.get("created_at"),
@@ -135,37 +366,135 @@ class Task:
             description=d.get("description"),
         )
 
-class TaskManager:
+class TaskManager(QObject):
+    # Bulk changes announce themselves once; views refresh on it
+    tasks_changed = Signal(str)
+
     def __init__(self):
+        super().__init__()
         self.tasks = []
+        self._open_by_cat = {cat: [] for cat in CATEGORIES}
+        self._done = []  # archived tasks by completion time
+
+        # Writes are coalesced: save() only marks dirty and (re)arms the timer
+        self._dirty = False
+        self._last_digest = None
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.flush)
+
         self.load()
 
     def load(self):
         if os.path.exists(DATA_FILE):
             try:
-                with open(DATA_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(DATA_FILE, "rb") as f:
+                    data = json_loads(f.read())
                 self.tasks = [Task.from_dict(t) for t in data]
             except Exception:
                 self.tasks = []
         else:
             self.tasks = []
+        self._rebuild_buckets()
+
+    # ---------------------- Tasks by status / category ---------------------- #
+    # Every status or category change goes through the mutators below, which
+    # keep these indexes current so views never rescan self.tasks
+    def _rebuild_buckets(self):
+        self._open_by_cat = {cat: [] for cat in CATEGORIES}
+        self._done = []
+        for t in self.tasks:
+            if t.status == "open":
+                self._open_by_cat[t.category].append(t)
+            elif t.status == "done":
+                self._done.append(t)
+        for bucket in self._open_by_cat.values():
+            bucket.sort(key=lambda t: t.sort_key)
+        self._done.sort(key=lambda t: t.completed_at or "")
+
+    def _bucket(self, task):
+        if task.status == "open":
+            bisect.insort(self._open_by_cat[task.category], task, key=lambda t: t.sort_key)
+        elif task.status == "done":
+            bisect.insort(self._done, task, key=lambda t: t.completed_at or "")
+
+    def _unbucket(self, task):
+        if task.status == "open":
+            self._open_by_cat[task.category].remove(task)
+        elif task.status == "done":
+            self._done.remove(task)
+
+    def open_tasks_in(self, category):
+        """Open tasks of a category, already in display order."""
+        return self._open_by_cat[category]
+
+    def done_tasks(self):
+        """Archived tasks, oldest completion first."""
+        return self._done
+
+    def open_count(self):
+        return sum(len(b) for b in self._open_by_cat.values())
+
+    def done_count(self):
+        return len(self._done)
+
+    def category_counts(self):
+        """Open tasks per category."""
+        return {cat: len(self._open_by_cat[cat]) for cat in CATEGORIES}
 
     def save(self):
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump([t.to_dict() for t in self.tasks], f, indent=2)
+        self._dirty = True
+        self._save_timer.start(500)
+
+    def flush(self):
+        self._save_timer.stop()
+        if not self._dirty:
+            return
+
+        data = json_dumps([t.to_dict() for t in self.tasks])
+        digest = hashlib.sha1(data).digest()
+        if digest != self._last_digest:
+            write_file_atomic(DATA_FILE, data)
+            self._last_digest = digest
+        self._dirty = False
 
     def add_task(self, task: Task):
+        if not task.created_at:
+            task.created_at = datetime.now().isoformat()
         self.tasks.append(task)
+        self._bucket(task)
         self.save()
 
     def all_open_tasks(self):
-        return [t for t in self.tasks if t.status == "open"]
+        return [t for cat in CATEGORIES for t in self._open_by_cat[cat]]
 
     def all_tasks(self):
         return self.tasks
 
+    def move_task(self, task: Task, category: str):
+        """Set the category and re-insert the task at its sorted position."""
+        self._unbucket(task)
+        task.category = category
+        self._bucket(task)
+
+    def update_task(self, task: Task):
+        """Re-sort a task after its due date or title changed."""
+        self.move_task(task, task.category)
+
+    def restore_task(self, task: Task, category: str):
+        self._unbucket(task)
+        task.category = category
+        task.status = "open"
+        self._bucket(task)
+        self.save()
+
+    def remove_task(self, task: Task):
+        self.tasks.remove(task)
+        self._unbucket(task)
+        self.save()
+
     def archive_task(self, task: Task, comment: str | None):
+        self._unbucket(task)
         task.status = "done"
 
         # 🔥 FIX: preserve original category
@@ -174,7 +503,32 @@ class TaskManager:
 
         task.completed_at = datetime.now().isoformat()
         task.closing_comment = comment
+        self._bucket(task)
+        self.save()
+
+    def bulk_remove(self, predicate):
+        """Delete every task matching predicate in one pass; returns how many."""
+        kept = []
+        removed = set()
+        for t in self.tasks:
+            if predicate(t):
+                removed.add(id(t))
+            else:
+                kept.append(t)
+        if not removed:
+            return 0
+
+        self.tasks = kept
+        # Filter in place: open_tasks_in() and done_tasks() hand out these same lists
+        for bucket in (*self._open_by_cat.values(), self._done):
+            bucket[:] = [t for t in bucket if id(t) not in removed]
         self.save()
+        self.tasks_changed.emit("bulk_remove")
+        return len(removed)
+
+    def clear_done(self):
+        """Permanently delete all archived tasks."""
+        return self.bulk_remove(lambda t: t.status == "done")
 
 # ---------------------- Create Task Dialog ---------------------- #
 
@@ -189,18 +543,8 @@ class CalendarDialog(QDialog):
         self.calendar = QCalendarWidget()
         self.calendar.setGridVisible(True)
         self.calendar.setSelectionMode(QCalendarWidget.SelectionMode.SingleSelection)
-
-        # Today highlight (yellow)
-        today = QDate.currentDate()
-        fmt_today = QTextCharFormat()
-        fmt_today.setBackground(QColor("yellow"))
-        self.calendar.setDateTextFormat(today, fmt_today)
-
-        # Initial date
-        if initial_date:
-            self.calendar.setSelectedDate(initial_date)
-        else:
-            self.calendar.setSelectedDate(today)
+        self._today = None
+        self.set_date(initial_date)
 
         layout.addWidget(self.calendar)
 
@@ -216,7 +560,7 @@ class CalendarDialog(QDialog):
 
         # Today button
         today_btn = QPushButton("Today")
-        today_btn.clicked.connect(lambda: self.calendar.setSelectedDate(today))
+        today_btn.clicked.connect(lambda: self.calendar.setSelectedDate(QDate.currentDate()))
         layout.addWidget(today_btn)
 
         # OK / Cancel buttons
@@ -225,6 +569,20 @@ class CalendarDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+    def set_date(self, date):
+        # Today highlight (yellow); move it if the day rolled over since last use
+        today = QDate.currentDate()
+        if today != self._today:
+            if self._today is not None:
+                self.calendar.setDateTextFormat(self._today, QTextCharFormat())
+            self.calendar.setDateTextFormat(today, TODAY_FORMAT)
+            self._today = today
+
+        if date is not None and date.isValid():
+            self.calendar.setSelectedDate(date)
+        else:
+            self.calendar.setSelectedDate(today)
+
     def update_selected_label(self, date):
         self.selected_label.setText(f"Selected date: {date.toString('dd.MM.yyyy')}")
 
@@ -232,6 +590,28 @@ class CalendarDialog(QDialog):
         return self.calendar.selectedDate()
 
 
+# The calendar widget is costly to build, so all deadline pickers share one
+_calendar_dialog = None
+
+
+def choose_date(parent, initial_date=None):
+    """Show the shared calendar dialog; returns the picked QDate or None."""
+    global _calendar_dialog
+    if _calendar_dialog is None:
+        _calendar_dialog = CalendarDialog()
+
+    dlg = _calendar_dialog
+    dlg.setParent(parent, dlg.windowFlags())
+    dlg.set_date(initial_date)
+    try:
+        if dlg.exec() == QDialog.Accepted:
+            return dlg.selected_date()
+        return None
+    finally:
+        # Detach again so the dialog outlives short-lived parents
+        dlg.setParent(None, dlg.windowFlags())
+
+
 class CreateTaskDialog(QDialog):
     def __init__(self, manager: TaskManager, parent=None):
         super().__init__(parent)
@@ -300,9 +680,9 @@ class CreateTaskDialog(QDialog):
         self.setLayout(layout)
 
     def open_calendar_dialog(self):
-        dlg = CalendarDialog(self, self.due_date_edit.date())
-        if dlg.exec() == QDialog.Accepted:
-            self.due_date_edit.setDate(dlg.selected_date())
+        date = choose_date(self, self.due_date_edit.date())
+        if date is not None:
+            self.due_date_edit.setDate(date)
 
     def save_task(self):
         title = self.title_edit.text().strip()
@@ -311,7 +691,7 @@ class CreateTaskDialog(QDialog):
             return
 
         category = self.category_combo.currentText().strip().lower()
-        if category not in ("do", "plan", "delegate", "wait"):
+        if category not in VALID_CATEGORIES:
             QMessageBox.warning(self, "Missing category", "Please choose a category.")
             return
 
@@ -330,24 +710,28 @@ class CreateTaskDialog(QDialog):
 # ---------------------- Edit Task Dialog ---------------------- #
 
 class EditTaskDialog(QDialog):
-    def __init__(self, manager: TaskManager, task: Task, parent=None):
+    """Built once per view and reused; load() swaps in the task to edit."""
+
+    def __init__(self, manager: TaskManager, task: Task = None, parent=None):
         super().__init__(parent)
         self.manager = manager
-        self.task = task
+        self.task = None
         self.setWindowTitle("Edit Task")
         self.setMinimumWidth(500)
         self.init_ui()
+        if task is not None:
+            self.load(task)
 
     def init_ui(self):
         layout = QVBoxLayout()
         form = QFormLayout()
 
         # --- Title ---
-        self.title_edit = QLineEdit(self.task.title)
+        self.title_edit = QLineEdit()
         form.addRow("Title:", self.title_edit)
 
         # --- Description ---
-        self.description_edit = QTextEdit(self.task.description or "")
+        self.description_edit = QTextEdit()
         self.description_edit.setFixedHeight(80)
         form.addRow("Description:", self.description_edit)
 
@@ -365,16 +749,6 @@ class EditTaskDialog(QDialog):
         self.due_date_edit.setDisplayFormat("dd.MM.yyyy")
         self.due_date_edit.setCalendarPopup(False)  # we use our own dialog
 
-        # Load existing date
-        if self.task.due_date:
-            try:
-                dt = datetime.strptime(self.task.due_date, "%Y-%m-%d")
-                self.due_date_edit.setDate(dt)
-            except Exception:
-                self.due_date_edit.setDate(datetime.now())
-        else:
-            self.due_date_edit.setDate(datetime.now())
-
         # Calendar button
         calendar_btn = QPushButton("📅")
         calendar_btn.setFixedWidth(32)
@@ -388,9 +762,6 @@ class EditTaskDialog(QDialog):
         # --- Category ---
         self.category_combo = QComboBox()
         self.category_combo.addItems(["Do", "Plan", "Delegate", "Wait"])
-        if self.task.category in ("do", "plan", "delegate", "wait"):
-            idx = {"do": 0, "plan": 1, "delegate": 2, "wait": 3}[self.task.category]
-            self.category_combo.setCurrentIndex(idx)
         form.addRow("Category:", self.category_combo)
 
         layout.addLayout(form)
@@ -417,11 +788,29 @@ class EditTaskDialog(QDialog):
         layout.addLayout(btns)
         self.setLayout(layout)
 
+    # --- Populate widgets for a task ---
+    def load(self, task: Task):
+        self.task = task
+        self.title_edit.setText(task.title)
+        self.description_edit.setPlainText(task.description or "")
+
+        # Load existing date (parsed once by the task, via QDate)
+        due = task.due_qdate
+        self.due_date_edit.setDate(due if due.isValid() else QDate.currentDate())
+
+        if task.category in CATEGORIES:
+            self.category_combo.setCurrentIndex(CATEGORIES.index(task.category))
+        else:
+            self.category_combo.setCurrentIndex(0)
+
+        self.comment_edit.clear()
+        self.title_edit.setFocus()
+
     # --- Calendar dialog ---
     def open_calendar_dialog(self):
-        dlg = CalendarDialog(self, self.due_date_edit.date())
-        if dlg.exec() == QDialog.Accepted:
-            self.due_date_edit.setDate(dlg.selected_date())
+        date = choose_date(self, self.due_date_edit.date())
+        if date is not None:
+            self.due_date_edit.setDate(date)
 
     # --- Save changes ---
     def save_changes(self):
@@ -430,8 +819,9 @@ class EditTaskDialog(QDialog):
         self.task.due_date = self.due_date_edit.date().toString("yyyy-MM-dd")
 
         cat = self.category_combo.currentText().strip().lower()
-        if cat in ("do", "plan", "delegate", "wait"):
-            self.task.category = cat
+        if cat not in VALID_CATEGORIES:
+            cat = self.task.category
+        self.manager.move_task(self.task, cat)
 
         self.manager.save()
         self.accept()
@@ -465,32 +855,238 @@ class EditTaskDialog(QDialog):
         dlg.setLayout(layout)
         dlg.exec()
 
+# ---------------------- Matrix list model ---------------------- #
+
+class TaskListModel(QAbstractListModel):
+    """Open tasks of one quadrant, in display order."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tasks = []
+        self.today = QDate.currentDate()
+
+    def apply(self, new_tasks):
+        """Update rows to match new_tasks, emitting only the delta."""
+        new_tasks = list(new_tasks)
+        self.today = QDate.currentDate()
+        wanted = {id(t) for t in new_tasks}
+
+        # Remove rows no longer wanted, back to front in contiguous runs
+        row = len(self.tasks) - 1
+        while row >= 0:
+            if id(self.tasks[row]) in wanted:
+                row -= 1
+                continue
+            last = row
+            while row > 0 and id(self.tasks[row - 1]) not in wanted:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, last)
+            del self.tasks[row:last + 1]
+            self.endRemoveRows()
+            row -= 1
+
+        # Walk the target order, moving or inserting rows as needed
+        present = {id(t) for t in self.tasks}
+        for row, task in enumerate(new_tasks):
+            if row < len(self.tasks) and self.tasks[row] is task:
+                continue
+            if id(task) in present:
+                src = next(i for i in range(row + 1, len(self.tasks)) if self.tasks[i] is task)
+                self.beginMoveRows(QModelIndex(), src, src, QModelIndex(), row)
+                self.tasks.insert(row, self.tasks.pop(src))
+                self.endMoveRows()
+            else:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self.tasks.insert(row, task)
+                self.endInsertRows()
+                present.add(id(task))
+
+        # Task fields (and today) may have changed for rows that stayed
+        if self.tasks:
+            self.dataChanged.emit(self.index(0), self.index(len(self.tasks) - 1))
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.tasks)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    # ---------------------- Overdue Helper ---------------------- #
+    def is_overdue(self, task):
+        d = task.due_qdate
+        return d.isValid() and d < self.today
+
+    # ---------------------- Due Soon Helper ---------------------- #
+    def is_due_today_or_tomorrow(self, task):
+        d = task.due_qdate
+        if not d.isValid():
+            return False
+        return d == self.today or d == self.today.addDays(1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        task = self.tasks[index.row()]
+
+        if role == Qt.UserRole:
+            return task
+
+        if role == Qt.DisplayRole:
+            return task.title
+
+        # Overdue / due-soon highlighting
+        if role == Qt.ForegroundRole:
+            if self.is_overdue(task):
+                return OVERDUE_COLOR
+            if self.is_due_today_or_tomorrow(task):
+                return DUE_SOON_COLOR
+            return DEFAULT_TEXT_COLOR
+
+        return None
+
+
+class TaskRowDelegate(QStyledItemDelegate):
+    """Paints a task row as title | date | description, elided to fit."""
+
+    MARGIN_H = 4
+    MARGIN_V = 2
+    SPACING = 8
+    TITLE_MIN_WIDTH = 100
+    TITLE_MAX_WIDTH = 180
+    DATE_WIDTH = 80
+    ELIDE_CACHE_SIZE = 4096
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Rows are repainted far more often than their text changes
+        self._elided = {}        # (bold, text, width) -> elided text
+        self._title_widths = {}  # title -> title column width
+        self._cache_font = None
+        self._font_serial = 0
+        self._row_size = None
+        self._bold_font = None
+        self._bold_metrics = None
+
+    def _sync_font(self, option):
+        # Cached text and row size only hold for the font they were measured with
+        if option.font == self._cache_font:
+            return
+        self._elided.clear()
+        self._title_widths.clear()
+        self._cache_font = QFont(option.font)
+        self._font_serial += 1
+        self._bold_font = QFont(option.font)
+        self._bold_font.setBold(True)
+        self._bold_metrics = QFontMetrics(self._bold_font)
+        width = self.MARGIN_H * 2 + self.TITLE_MIN_WIDTH + self.SPACING + self.DATE_WIDTH
+        self._row_size = QSize(width, option.fontMetrics.height() + 2 * self.MARGIN_V + 4)
+
+    def _elide(self, fm, bold, text, width):
+        key = (bold, text, width)
+        elided = self._elided.get(key)
+        if elided is None:
+            if len(self._elided) >= self.ELIDE_CACHE_SIZE:
+                self._elided.clear()
+            elided = fm.elidedText(text, Qt.ElideRight, width)
+            self._elided[key] = elided
+        return elided
+
+    def _title_width(self, fm, title):
+        width = self._title_widths.get(title)
+        if width is None:
+            if len(self._title_widths) >= self.ELIDE_CACHE_SIZE:
+                self._title_widths.clear()
+            width = min(
+                max(fm.horizontalAdvance(title), self.TITLE_MIN_WIDTH),
+                self.TITLE_MAX_WIDTH,
+            )
+            self._title_widths[title] = width
+        return width
+
+    def paint(self, painter, option, index):
+        task = index.data(Qt.UserRole)
+        self._sync_font(option)
+
+        # Background, selection and focus from the current style
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        # Text is rendered once per task revision / size / colour and reused
+        pen = index.data(Qt.ForegroundRole)
+        dpr = painter.device().devicePixelRatioF()
+        size = option.rect.size()
+        key = (
+            f"task:{id(task)}:{task._revision}:{self._font_serial}:"
+            f"{size.width()}x{size.height()}:{pen.name()}:{dpr}"
+        )
+        pm = QPixmapCache.find(key)
+        if pm is None:
+            pm = QPixmap(size * dpr)
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.transparent)
+            pm_painter = QPainter(pm)
+            self._paint_text(pm_painter, option, task, pen, QRect(QPoint(0, 0), size))
+            pm_painter.end()
+            QPixmapCache.insert(key, pm)
+        painter.drawPixmap(option.rect.topLeft(), pm)
+
+    def _paint_text(self, painter, option, task, pen, row_rect):
+        rect = row_rect.adjusted(self.MARGIN_H, self.MARGIN_V, -self.MARGIN_H, -self.MARGIN_V)
+        align = Qt.AlignLeft | Qt.AlignVCenter
+
+        fm_title = self._bold_metrics
+        fm = option.fontMetrics
+
+        # --- TITLE ---
+        title_width = self._title_width(fm_title, task.title)
+        title_rect = QRect(rect.left(), rect.top(), title_width, rect.height())
+
+        # --- DATE ---
+        date_rect = QRect(title_rect.right() + 1 + self.SPACING, rect.top(), self.DATE_WIDTH, rect.height())
+
+        # --- DESCRIPTION ---
+        desc_left = date_rect.right() + 1 + self.SPACING
+        desc_rect = QRect(desc_left, rect.top(), max(rect.right() + 1 - desc_left, 0), rect.height())
+        desc = task.description_flat
+
+        painter.setPen(pen)
+
+        painter.setFont(self._bold_font)
+        painter.drawText(title_rect, align, self._elide(fm_title, True, task.title, title_rect.width()))
+
+        painter.setFont(option.font)
+        painter.drawText(date_rect, align, self._elide(fm, False, task.due_display, date_rect.width()))
+        painter.drawText(desc_rect, align, self._elide(fm, False, desc, desc_rect.width()))
+
+    def sizeHint(self, option, index):
+        # Fixed row height: no per-row text measuring
+        self._sync_font(option)
+        return self._row_size
+
 # ---------------------- Matrix + drag & drop ---------------------- #
 
 class MatrixView(QWidget):
+    # Live matrices, so other views can reach them without walking the widget tree
+    _instances = weakref.WeakSet()
+
     def __init__(self, manager, refresh_all_callback):
         super().__init__()
         self.manager = manager
         self.refresh_all_callback = refresh_all_callback
         self.last_dragged_task = None
+        self._edit_dialog = None
+        self._stale = False
+        MatrixView._instances.add(self)
         self.init_ui()
-
-    # ---------------------- Overdue Helper ---------------------- #
-    def is_overdue(self, date_str):
-        if not date_str:
-            return False
-        d = QDate.fromString(date_str, "yyyy-MM-dd")
-        return d.isValid() and d < QDate.currentDate()
-
-    # ---------------------- Due Soon Helper ---------------------- #
-    def is_due_today_or_tomorrow(self, date_str):
-        if not date_str:
-            return False
-        d = QDate.fromString(date_str, "yyyy-MM-dd")
-        if not d.isValid():
-            return False
-        today = QDate.currentDate()
-        return d == today or d == today.addDays(1)
+        manager.tasks_changed.connect(self.refresh)
 
     # ---------------------- UI SETUP ---------------------- #
     def init_ui(self):
@@ -537,267 +1133,76 @@ class MatrixView(QWidget):
 
     # ---------------------- MAIN REFRESH ---------------------- #
     def refresh(self):
-        # Clear all quadrants
+        # A hidden matrix only remembers to refresh; showEvent catches up
+        if not self.isVisible():
+            self._stale = True
+            return
+        self._stale = False
+
+        # Open tasks are grouped, normalized and sorted by the manager;
+        # repaint each quadrant once after its rows are updated
         for lst in (self.q_do, self.q_plan, self.q_delegate, self.q_wait):
-            lst.clear()
-
-        # --- Helpers for sorting/grouping ---
-        def parse_due(t):
-            """Return datetime for due_date or None if missing/invalid."""
-            ds = getattr(t, "due_date", None)
-            if not ds:
-                return None
+            lst.setUpdatesEnabled(False)
             try:
-                return datetime.strptime(ds, "%Y-%m-%d")
-            except Exception:
-                return None
-
-        def parse_created_at(t):
-            """Optional: provide stable tie-breaker if Task has created_at."""
-            c = getattr(t, "created_at", None)
-            if isinstance(c, datetime):
-                return c
-            if isinstance(c, str):
-                try:
-                    # Accept ISO-like strings
-                    return datetime.fromisoformat(c)
-                except Exception:
-                    pass
-            return datetime.min  # fallback
-
-        def norm_cat(cat):
-            c = (cat or "").strip().lower()
-            if c == "ask":  # normalize legacy
-                c = "delegate"
-            if c not in ("do", "plan", "delegate", "wait"):
-                c = "plan"
-            return c
-
-        # Group tasks by normalized category
-        buckets = {"do": [], "plan": [], "delegate": [], "wait": []}
-        for t in self.manager.all_open_tasks():
-            c = norm_cat(getattr(t, "category", None))
-            t.category = c  # ensure normalized
-            buckets[c].append(t)
-
-        # Sort each category by due date ascending; undated last
-        def sort_key(t):
-            d = parse_due(t)
-            return (
-                d is None,                  # dated first (False < True)
-                d or datetime.max,          # actual due date (or max for undated)
-                parse_created_at(t),        # tie-breaker if available
-                getattr(t, "title", ""),    # final deterministic tie-breaker
-            )
+                lst.task_model.apply(self.manager.open_tasks_in(lst.category_name))
+            finally:
+                lst.setUpdatesEnabled(True)
 
-        for cat in buckets:
-            buckets[cat].sort(key=sort_key)
-
-        # Populate UI
-        def add_task_to_widget(t, target_list):
-            desc = (t.description or "").replace("\n", " ").strip()
-
-            # Format date for display
-            if t.due_date:
-                try:
-                    dt = datetime.strptime(t.due_date, "%Y-%m-%d")
-                    date_str = dt.strftime("%d.%m.%Y")
-                except Exception:
-                    date_str = t.due_date
-            else:
-                date_str = "(no date)"
-
-            # Build row widget
-            widget = QWidget()
-            h = QHBoxLayout(widget)
-            h.setContentsMargins(4, 2, 4, 2)
-            h.setSpacing(8)
-
-            widget.setMaximumWidth(self.width() - 20)
-
-            # --- TITLE ---
-            title_label = QLabel(t.title)
-            font = title_label.font()
-            font.setBold(True)
-            title_label.setFont(font)
-            title_label.setMinimumWidth(100)
-            title_label.setMaximumWidth(180)
-            title_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
-
-            # --- DATE ---
-            date_label = QLabel(date_str)
-            date_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            date_label.setMinimumWidth(80)
-            date_label.setMaximumWidth(80)
-            date_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
-
-            # --- DESCRIPTION ---
-            desc_label = QLabel(desc)
-            desc_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-            desc_label.setMinimumWidth(0)
-
-            h.addWidget(title_label)
-            h.addWidget(date_label)
-            h.addWidget(desc_label)
-
-            h.setStretch(0, 0)
-            h.setStretch(1, 0)
-            h.setStretch(2, 1)
-
-            # Update elision on resize
-            widget.resizeEvent = lambda event, w=widget, task=t: self.update_elision(w, task)
-
-            # Create list item
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, t)
-            item.setSizeHint(widget.sizeHint())
-
-            # Overdue / due-soon highlighting
-            if self.is_overdue(t.due_date):
-                color = "red"
-            elif self.is_due_today_or_tomorrow(t.due_date):
-                color = "#e67e22"  # orange
-            else:
-                color = "black"
-
-            title_label.setStyleSheet(f"color: {color};")
-            date_label.setStyleSheet(f"color: {color};")
-            desc_label.setStyleSheet(f"color: {color};")
-
-            target_list.addItem(item)
-            target_list.setItemWidget(item, widget)
-
-        for t in buckets["do"]:
-            add_task_to_widget(t, self.q_do)
-        for t in buckets["plan"]:
-            add_task_to_widget(t, self.q_plan)
-        for t in buckets["delegate"]:
-            add_task_to_widget(t, self.q_delegate)
-        for t in buckets["wait"]:
-            add_task_to_widget(t, self.q_wait)
-
-    # ---------------------- ELLIPSIZING ---------------------- #
-    def update_elision(self, widget, task):
-        layout = widget.layout()
-        title_label = layout.itemAt(0).widget()
-        date_label  = layout.itemAt(1).widget()
-        desc_label  = layout.itemAt(2).widget()
-
-        # Title
-        fm_title = title_label.fontMetrics()
-        title_label.setText(
-            fm_title.elidedText(task.title, Qt.ElideRight, title_label.width())
-        )
-
-        # Description
-        desc = (task.description or "").replace("\n", " ").strip()
-        fm_desc = desc_label.fontMetrics()
-        desc_label.setText(
-            fm_desc.elidedText(desc, Qt.ElideRight, desc_label.width())
-        )
-
-    # ---------------------- RESIZE HANDLER ---------------------- #
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self.refresh()
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._stale:
+            self.refresh()
 
     # ---------------------- EDIT TASK ---------------------- #
-    def edit_task_from_item(self, item: QListWidgetItem):
-        task = item.data(Qt.UserRole)
-        dlg = EditTaskDialog(self.manager, task, self)
-        if dlg.exec():
+    def edit_task_from_index(self, index):
+        task = index.data(Qt.UserRole)
+        if self._edit_dialog is None:
+            self._edit_dialog = EditTaskDialog(self.manager, parent=self)
+        self._edit_dialog.load(task)
+        if self._edit_dialog.exec():
             self.refresh_all_callback()
 
     # ---------------------- DEADLINE UPDATE ---------------------- #
     def ask_deadline_update(self, task):
-        dlg = QDialog(self)
-        dlg.setWindowTitle("Choose new deadline")
-        v = QVBoxLayout(dlg)
-
-        # Calendar
-        cal = QCalendarWidget()
-        cal.setGridVisible(True)
-        cal.setSelectionMode(QCalendarWidget.SelectionMode.SingleSelection)
-
-        # Today highlight
-        today = QDate.currentDate()
-        fmt_today = QTextCharFormat()
-        fmt_today.setBackground(QColor("yellow"))
-        cal.setDateTextFormat(today, fmt_today)
-
-        # Initial date
-        if task.due_date:
-            try:
-                dt = datetime.strptime(task.due_date, "%Y-%m-%d")
-                cal.setSelectedDate(QDate(dt.year, dt.month, dt.day))
-            except Exception:
-                cal.setSelectedDate(today)
-        else:
-            cal.setSelectedDate(today)
-
-        v.addWidget(cal)
-
-        # Selected date label
-        selected_label = QLabel()
-        selected_label.setText(f"Selected date: {cal.selectedDate().toString('dd.MM.yyyy')}")
-        v.addWidget(selected_label)
-
-        # Update label when user clicks a date
-        cal.selectionChanged.connect(
-            lambda: selected_label.setText(
-                f"Selected date: {cal.selectedDate().toString('dd.MM.yyyy')}"
-            )
-        )
-
-        # Today button
-        today_btn = QPushButton("Today")
-        today_btn.clicked.connect(lambda: cal.setSelectedDate(today))
-        v.addWidget(today_btn)
-
-        # OK / Cancel
-        btns = QHBoxLayout()
-        ok = QPushButton("OK")
-        cancel = QPushButton("Cancel")
-        ok.clicked.connect(dlg.accept)
-        cancel.clicked.connect(dlg.reject)
-        btns.addStretch()
-        btns.addWidget(ok)
-        btns.addWidget(cancel)
-        v.addLayout(btns)
-
-        if dlg.exec():
-            selected = cal.selectedDate()
+        selected = choose_date(self, task.due_qdate)
+        if selected is not None:
             task.due_date = selected.toString("yyyy-MM-dd")
+            self.manager.update_task(task)
             # Notify the outer UI to refresh if that's your pattern elsewhere
             if callable(self.refresh_all_callback):
                 self.refresh_all_callback()
 
 
-class CategoryList(QListWidget):
+class CategoryList(QListView):
     def __init__(self, category_name, parent_matrix):
         super().__init__()
         self.category_name = category_name
         self.parent_matrix = parent_matrix
 
-        self.setSelectionMode(QListWidget.SingleSelection)
+        self.task_model = TaskListModel(self)
+        self.setModel(self.task_model)
+        self.setItemDelegate(TaskRowDelegate(self))
+
+        self.setUniformItemSizes(True)  # every row has the delegate's fixed height
+        self.setSelectionMode(QListView.SingleSelection)
         self.setDragEnabled(True)
         self.setAcceptDrops(True)
         self.setDropIndicatorShown(True)
-        self.setDragDropMode(QListWidget.DragDrop)
+        self.setDragDropMode(QListView.DragDrop)
 
         self.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: #ffffff;
                 color: #000000;
             }
         """)
 
-        self.itemDoubleClicked.connect(self.parent_matrix.edit_task_from_item)
+        self.doubleClicked.connect(self.parent_matrix.edit_task_from_index)
 
     def startDrag(self, supportedActions):
-        item = self.currentItem()
-        if item:
-            self.parent_matrix.last_dragged_task = item.data(Qt.UserRole)
+        index = self.currentIndex()
+        if index.isValid():
+            self.parent_matrix.last_dragged_task = index.data(Qt.UserRole)
         super().startDrag(supportedActions)
 
     def dragEnterEvent(self, event):
@@ -807,7 +1212,7 @@ class CategoryList(QListWidget):
         event.acceptProposedAction()
 
     def dropEvent(self, event):
-        super().dropEvent(event)
+        # Rows are owned by the model; the category change below moves them
         event.acceptProposedAction()
 
         task = self.parent_matrix.last_dragged_task
@@ -834,7 +1239,7 @@ class CategoryList(QListWidget):
             QMessageBox.No,
         )
 
-        task.category = new
+        self.parent_matrix.manager.move_task(task, new)
 
         if choice == QMessageBox.Yes:
             self.parent_matrix.ask_deadline_update(task)
@@ -844,12 +1249,67 @@ class CategoryList(QListWidget):
 
 # ---------------------- Timeline ---------------------- #
 
+class TimelineModel(QAbstractListModel):
+    """Open tasks by due date; row labels are built only when a view asks."""
+
+    DESC_MAX_LEN = 80
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tasks = []
+        self.today = QDate.currentDate()
+
+    def set_tasks(self, tasks):
+        self.beginResetModel()
+        self.tasks = list(tasks)
+        self.today = QDate.currentDate()
+        self.endResetModel()
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.tasks)
+
+    def label(self, t):
+        desc = t.description_flat
+        if len(desc) > self.DESC_MAX_LEN:
+            desc = desc[:self.DESC_MAX_LEN] + "…"
+
+        label = f"{t.due_display}   [{t.category.upper()}]   {t.title}"
+        if desc:
+            label += f" — {desc}"
+        return label
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        task = self.tasks[index.row()]
+
+        if role == Qt.UserRole:
+            return task
+
+        if role == Qt.DisplayRole:
+            return self.label(task)
+
+        # Due today counts as overdue here (deadline is start of day)
+        if role == Qt.ForegroundRole:
+            due = task.due_qdate
+            if due.isValid() and due <= self.today:
+                return OVERDUE_COLOR
+            return DEFAULT_TEXT_COLOR
+
+        return None
+
+
 class TimelineView(QWidget):
     def __init__(self, manager: TaskManager, refresh_all_callback):
         super().__init__()
         self.manager = manager
         self.refresh_all_callback = refresh_all_callback
+        self._edit_dialog = None
         self.init_ui()
+        manager.tasks_changed.connect(self.refresh)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -858,55 +1318,27 @@ class TimelineView(QWidget):
         title.setStyleSheet("font-size: 20px; font-weight: bold; color: #2980b9;")
         layout.addWidget(title)
 
-        self.list = QListWidget()
-        self.list.itemDoubleClicked.connect(self.edit_task_from_item)
+        self.model = TimelineModel(self)
+        self.list = QListView()
+        self.list.setModel(self.model)
+        self.list.setUniformItemSizes(True)
+        self.list.doubleClicked.connect(self.edit_task_from_index)
         layout.addWidget(self.list)
 
         self.setLayout(layout)
         self.refresh()
 
     def refresh(self):
-        self.list.clear()
-        tasks = [t for t in self.manager.all_open_tasks()]
+        tasks = self.manager.all_open_tasks()
         tasks.sort(key=lambda t: (t.due_date is None, t.due_date or ""))
-
-        for t in tasks:
-            desc = (t.description or "").replace("\n", " ").strip()
-            max_len = 80
-            if len(desc) > max_len:
-                desc = desc[:max_len] + "…"
-
-            if t.due_date:
-                try:
-                    dt = datetime.strptime(t.due_date, "%Y-%m-%d")
-                    date_str = dt.strftime("%d.%m.%Y")
-                except Exception:
-                    date_str = t.due_date
-            else:
-                date_str = "(no date)"
-
-            label = f"{date_str}   [{t.category.upper()}]   {t.title}"
-            if desc:
-                label += f" — {desc}"
-
-            item = QListWidgetItem(label)
-            item.setData(Qt.UserRole, t)
-            item.setForeground(Qt.black)
-
-            if t.due_date:
-                try:
-                    due = datetime.strptime(t.due_date, "%Y-%m-%d")
-                    if due < datetime.now():
-                        item.setForeground(Qt.red)
-                except Exception:
-                    pass
-
-            self.list.addItem(item)
-
-    def edit_task_from_item(self, item: QListWidgetItem):
-        task = item.data(Qt.UserRole)
-        dlg = EditTaskDialog(self.manager, task, self)
-        if dlg.exec():
+        self.model.set_tasks(tasks)
+
+    def edit_task_from_index(self, index):
+        task = index.data(Qt.UserRole)
+        if self._edit_dialog is None:
+            self._edit_dialog = EditTaskDialog(self.manager, parent=self)
+        self._edit_dialog.load(task)
+        if self._edit_dialog.exec():
             self.refresh_all_callback()
 
 # ---------------------- Archive Task ---------------------- #
@@ -918,10 +1350,7 @@ class ArchiveTaskDialog(QDialog):
         self.manager = manager
 
         # Preserve original category (normalize old values)
-        original = (task.category or "").strip().lower()
-        if original == "ask":
-            original = "delegate"
-        self.original_category = original or "plan"
+        self.original_category = normalize_category(task.category)
 
         self.setWindowTitle("Archived Task")
         self.setMinimumWidth(420)
@@ -976,19 +1405,7 @@ class ArchiveTaskDialog(QDialog):
         if not cat:
             cat = self.task.category
 
-        cat = (cat or "").strip().lower()
-
-        # Normalize old values
-        if cat == "ask":
-            cat = "delegate"
-
-        # Final safety
-        if cat not in ("do", "plan", "delegate", "wait"):
-            cat = "plan"
-
-        self.task.category = cat
-        self.task.status = "open"
-        self.manager.save()
+        self.manager.restore_task(self.task, normalize_category(cat))
         self.accept()
 
     def delete_task(self):
@@ -1000,8 +1417,7 @@ class ArchiveTaskDialog(QDialog):
             QMessageBox.No
         )
         if confirm == QMessageBox.Yes:
-            self.manager.tasks.remove(self.task)
-            self.manager.save()
+            self.manager.remove_task(self.task)
             self.accept()
 
 # ---------------------- Archive View ---------------------- #
@@ -1010,7 +1426,10 @@ class ArchiveView(QWidget):
     def __init__(self, manager: TaskManager):
         super().__init__()
         self.manager = manager
+        self._rows = []       # tasks in list order
+        self._row_cache = {}  # id(task) -> (revision, label)
         self.init_ui()
+        manager.tasks_changed.connect(self.refresh)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -1042,63 +1461,84 @@ class ArchiveView(QWidget):
         self.refresh()
 
     def refresh(self):
-        self.list.clear()
-        archive_tasks = [t for t in self.manager.all_tasks() if t.status == "done"]
-        archive_tasks.sort(key=lambda t: t.completed_at or "")
-
-        for t in archive_tasks:
-            if t.completed_at:
-                try:
-                    dt = datetime.fromisoformat(t.completed_at)
-                    date_str = dt.strftime("%d.%m.%Y")
-                except Exception:
-                    date_str = t.completed_at.split("T")[0]
-            else:
-                date_str = ""
-
-            desc = (t.description or "").replace("\n", " ").strip()
-            max_len = 80
-            if len(desc) > max_len:
-                desc = desc[:max_len] + "…"
+        archive_tasks = list(self.manager.done_tasks())
+
+        # Same rows as shown: only relabel tasks edited since last time
+        if len(archive_tasks) == len(self._rows) and all(
+            a is b for a, b in zip(archive_tasks, self._rows)
+        ):
+            for row, t in enumerate(archive_tasks):
+                cached = self._row_cache.get(id(t))
+                if cached is None or cached[0] != t._revision:
+                    self.list.item(row).setText(self._label(t))
+            return
 
-            label = f"{date_str}   {t.title}"
-            if desc:
-                label += f" — {desc}"
-            if t.closing_comment:
-                label += f"   (Comment: {t.closing_comment})"
+        self._rows = archive_tasks
+        live = {id(t) for t in archive_tasks}
+        for key in [k for k in self._row_cache if k not in live]:
+            del self._row_cache[key]
 
-            item = QListWidgetItem(label)
-            item.setData(Qt.UserRole, t)
-            item.setForeground(Qt.black)
-            self.list.addItem(item)
+        # Repopulate in one pass without per-item repaints
+        self.list.setUpdatesEnabled(False)
+        self.list.blockSignals(True)
+        try:
+            self.list.clear()
+            self.list.addItems([self._label(t) for t in archive_tasks])
+            for row, t in enumerate(archive_tasks):
+                self.list.item(row).setData(Qt.UserRole, t)
+        finally:
+            self.list.blockSignals(False)
+            self.list.setUpdatesEnabled(True)
+
+    def _label(self, t):
+        cached = self._row_cache.get(id(t))
+        if cached is not None and cached[0] == t._revision:
+            return cached[1]
+
+        desc = t.description_flat
+        max_len = 80
+        if len(desc) > max_len:
+            desc = desc[:max_len] + "…"
+
+        label = f"{t.completed_display}   {t.title}"
+        if desc:
+            label += f" — {desc}"
+        if t.closing_comment:
+            label += f"   (Comment: {t.closing_comment})"
+
+        self._row_cache[id(t)] = (t._revision, label)
+        return label
+
+    def _remove_row(self, task):
+        """Drop a single task's row without rebuilding the list."""
+        for row, t in enumerate(self._rows):
+            if t is task:
+                self.list.takeItem(row)
+                del self._rows[row]
+                break
+        self._row_cache.pop(id(task), None)
 
     def _refresh_all_matrices(self):
-        from PySide6.QtWidgets import QApplication
-
-        def refresh_in_widget(w):
-            # Direct MatrixView instances
-            if isinstance(w, MatrixView):
-                if hasattr(w, "refresh_all_callback") and w.refresh_all_callback:
-                    w.refresh_all_callback()
-                else:
-                    w.refresh()
-
-            # Any MatrixView children
-            for child in w.findChildren(MatrixView):
-                if hasattr(child, "refresh_all_callback") and child.refresh_all_callback:
-                    child.refresh_all_callback()
-                else:
-                    child.refresh()
-
-        for top in QApplication.topLevelWidgets():
-            refresh_in_widget(top)
+        # Each distinct refresh-all callback runs once; hidden matrices defer
+        # their own work until shown (see MatrixView.refresh)
+        callbacks = []
+        for mv in list(MatrixView._instances):
+            if mv.refresh_all_callback:
+                if mv.refresh_all_callback not in callbacks:
+                    callbacks.append(mv.refresh_all_callback)
+            else:
+                mv.refresh()
+
+        for callback in callbacks:
+            callback()
 
     def open_archived_task(self, item):
         task = item.data(Qt.UserRole)
         dlg = ArchiveTaskDialog(task, self.manager, self)
 
+        # Restored or deleted: either way the task leaves the archive
         if dlg.exec():
-            self.refresh()
+            self._remove_row(task)
             self._refresh_all_matrices()
 
     def delete_selected(self):
@@ -1118,9 +1558,8 @@ class ArchiveView(QWidget):
         )
 
         if confirm == QMessageBox.Yes:
-            self.manager.tasks.remove(task)
-            self.manager.save()
-            self.refresh()
+            self.manager.remove_task(task)
+            self._remove_row(task)
 
     def clear_archive(self):
         confirm = QMessageBox.question(
@@ -1132,10 +1571,7 @@ class ArchiveView(QWidget):
         )
 
         if confirm == QMessageBox.Yes:
-            self.manager.tasks = [t for t in self.manager.tasks if t.status != "done"]
-            self.manager.save()
-            self.refresh()
-            self._refresh_all_matrices()
+            self.manager.clear_done()  # views refresh on tasks_changed
 
 # ---------------------- Statistics ---------------------- #
 
@@ -1144,6 +1580,7 @@ class StatisticsView(QWidget):
         super().__init__()
         self.manager = manager
         self.init_ui()
+        manager.tasks_changed.connect(self.refresh)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -1157,62 +1594,66 @@ class StatisticsView(QWidget):
 
         self.chart_view = QChartView()
         layout.addWidget(self.chart_view)
+        self.build_chart()
 
         self.setLayout(layout)
+        self._last_counts = None
         self.refresh()
 
-    def refresh(self):
-        tasks = self.manager.all_tasks()
-        open_tasks = [t for t in tasks if t.status == "open"]
-        done_tasks = [t for t in tasks if t.status == "done"]
-
-        count_open = len(open_tasks)
-        count_done = len(done_tasks)
-
-        per_category = {"do": 0, "plan": 0, "delegate": 0, "wait": 0}
-        for t in open_tasks:
-            if t.category in per_category:
-                per_category[t.category] += 1
-
-        self.summary_label.setText(
-            f"Open tasks: {count_open}   |   Archived tasks: {count_done}\n"
-            f"Do: {per_category['do']}   Plan: {per_category['plan']}   "
-            f"Delegate: {per_category['delegate']}   Wait: {per_category['wait']}"
-        )
-
-        bar_set = QBarSet("Open tasks")
-        bar_set.append([
-            per_category["do"],
-            per_category["plan"],
-            per_category["delegate"],
-            per_category["wait"],
-        ])
+    def build_chart(self):
+        # Built once; refresh() only replaces the bar values
+        self.bar_set = QBarSet("Open tasks")
+        self.bar_set.append([0] * len(CATEGORIES))
 
         series = QBarSeries()
-        series.append(bar_set)
+        series.append(self.bar_set)
 
-        chart = QChart()
-        chart.addSeries(series)
-        chart.setTitle("Open tasks per category")
-        chart.setAnimationOptions(QChart.SeriesAnimations)
+        self.chart = QChart()
+        self.chart.addSeries(series)
+        self.chart.setTitle("Open tasks per category")
+        self.chart.setAnimationOptions(QChart.SeriesAnimations)
 
         categories = ["Do", "Plan", "Delegate", "Wait"]
         axis_x = QBarCategoryAxis()
         axis_x.append(categories)
-        chart.addAxis(axis_x, Qt.AlignBottom)
+        self.chart.addAxis(axis_x, Qt.AlignBottom)
         series.attachAxis(axis_x)
 
-        max_val = max(per_category.values()) if per_category.values() else 0
-        axis_y = QValueAxis()
-        axis_y.setRange(0, max_val + 1 if max_val > 0 else 1)
-        axis_y.setLabelFormat("%d")
-        chart.addAxis(axis_y, Qt.AlignLeft)
-        series.attachAxis(axis_y)
+        self.axis_y = QValueAxis()
+        self.axis_y.setRange(0, 1)
+        self.axis_y.setLabelFormat("%d")
+        self.chart.addAxis(self.axis_y, Qt.AlignLeft)
+        series.attachAxis(self.axis_y)
+
+        self.chart.legend().setVisible(True)
+        self.chart.legend().setAlignment(Qt.AlignBottom)
+
+        self.chart_view.setChart(self.chart)
 
-        chart.legend().setVisible(True)
-        chart.legend().setAlignment(Qt.AlignBottom)
+    def refresh(self):
+        count_open = self.manager.open_count()
+        count_done = self.manager.done_count()
+        per_category = self.manager.category_counts()
+
+        counts = (count_open, count_done, tuple(per_category[c] for c in CATEGORIES))
+        if counts == self._last_counts:
+            return
+        self._last_counts = counts
+
+        self.summary_label.setText(
+            f"Open tasks: {count_open}   |   Archived tasks: {count_done}\n"
+            f"Do: {per_category['do']}   Plan: {per_category['plan']}   "
+            f"Delegate: {per_category['delegate']}   Wait: {per_category['wait']}"
+        )
 
-        self.chart_view.setChart(chart)
+        # Replace values in place; no animation restart for every bar
+        self.chart.setAnimationOptions(QChart.NoAnimation)
+        for i, cat in enumerate(CATEGORIES):
+            self.bar_set.replace(i, per_category[cat])
+
+        max_val = max(per_category.values()) if per_category.values() else 0
+        self.axis_y.setRange(0, max_val + 1 if max_val > 0 else 1)
+        self.chart.setAnimationOptions(QChart.SeriesAnimations)
 
 # ------------------------- Image Resize -------------------------#
  
@@ -1297,6 +1738,7 @@ class FormattingToolbar(QWidget):
     def __init__(self, editor: QTextEdit, parent=None):
         super().__init__(parent)
         self.editor = editor
+        self.build_formats()
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -1356,6 +1798,34 @@ class FormattingToolbar(QWidget):
         h2_btn.clicked.connect(lambda: self.set_heading(2))
         layout.addWidget(h2_btn)
 
+    # ---------------- Preset formats ---------------- #
+
+    def build_formats(self):
+        # The fixed formats are built once and merged as-is on every click
+        self._fmt_bold = {}
+        for weight in (QFont.Bold, QFont.Normal):
+            fmt = QTextCharFormat()
+            fmt.setFontWeight(weight)
+            self._fmt_bold[weight] = fmt
+
+        self._fmt_italic = {}
+        self._fmt_underline = {}
+        for on in (True, False):
+            fmt = QTextCharFormat()
+            fmt.setFontItalic(on)
+            self._fmt_italic[on] = fmt
+
+            fmt = QTextCharFormat()
+            fmt.setFontUnderline(on)
+            self._fmt_underline[on] = fmt
+
+        self._fmt_heading = {}
+        for level, size, weight in ((0, 12, QFont.Normal), (1, 22, QFont.Bold), (2, 18, QFont.Bold)):
+            fmt = QTextCharFormat()
+            fmt.setFontPointSize(size)
+            fmt.setFontWeight(weight)
+            self._fmt_heading[level] = fmt
+
     # ---------------- Formatting actions ---------------- #
 
     def merge_format(self, fmt):
@@ -1364,19 +1834,14 @@ class FormattingToolbar(QWidget):
         self.editor.mergeCurrentCharFormat(fmt)
 
     def toggle_bold(self):
-        fmt = QTextCharFormat()
-        fmt.setFontWeight(QFont.Bold if self.editor.fontWeight() != QFont.Bold else QFont.Normal)
-        self.merge_format(fmt)
+        weight = QFont.Bold if self.editor.fontWeight() != QFont.Bold else QFont.Normal
+        self.merge_format(self._fmt_bold[weight])
 
     def toggle_italic(self):
-        fmt = QTextCharFormat()
-        fmt.setFontItalic(not self.editor.fontItalic())
-        self.merge_format(fmt)
+        self.merge_format(self._fmt_italic[not self.editor.fontItalic()])
 
     def toggle_underline(self):
-        fmt = QTextCharFormat()
-        fmt.setFontUnderline(not self.editor.fontUnderline())
-        self.merge_format(fmt)
+        self.merge_format(self._fmt_underline[not self.editor.fontUnderline()])
 
     def set_text_color(self):
         color = QColorDialog.getColor()
@@ -1401,49 +1866,58 @@ class FormattingToolbar(QWidget):
         cursor.insertList(QTextListFormat.ListDecimal)
 
     def set_heading(self, level):
-        cursor = self.editor.textCursor()
-        char_fmt = cursor.charFormat()
+        fmt = self._fmt_heading.get(level)
+        if fmt is not None:
+            cursor = self.editor.textCursor()
+            cursor.mergeCharFormat(fmt)
 
-        if level == 0:
-            char_fmt.setFontPointSize(12)
-            char_fmt.setFontWeight(QFont.Normal)
-        elif level == 1:
-            char_fmt.setFontPointSize(22)
-            char_fmt.setFontWeight(QFont.Bold)
-        elif level == 2:
-            char_fmt.setFontPointSize(18)
-            char_fmt.setFontWeight(QFont.Bold)
+# ---------------------- Rich Text Edit ---------------------- #
 
-        cursor.setCharFormat(char_fmt)
+def write_png(image: QImage, path):
+    # Low compression: pasted screenshots encode several times faster
+    writer = QImageWriter(path, b"png")
+    writer.setCompression(1)
+    if not writer.write(image):
+        print("ERROR saving image:", path, writer.errorString())
 
-# ---------------------- Rich Text Edit ---------------------- #
 
 class RichTextEdit(QTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_view = parent
 
-    def insertFromMimeData(self, source):
-        # Prefer text over image (fixes OneNote paste issue)
-        if source.hasText():
-            super().insertFromMimeData(source)
-            if self.parent_view:
-                self.parent_view.on_note_changed()
-            return
+    @staticmethod
+    def prefers_image(source):
+        # Text wins (OneNote paste fix) unless it is only a stub for the picture:
+        # blank, or HTML whose body is nothing but the image itself
+        if not source.hasImage():
+            return False
+        if source.hasHtml() and RichTextEdit.is_image_stub(source.html()):
+            return True
+        text = source.text() if source.hasText() else ""
+        if not text.strip():
+            return True
+        return text.lstrip().startswith("<") and RichTextEdit.is_image_stub(text)
 
-        # If no text but an image → insert image
-        if source.hasImage():
+    @staticmethod
+    def is_image_stub(html):
+        # Images render as U+FFFC, so a stub leaves no other visible text
+        plain = QTextDocumentFragment.fromHtml(html).toPlainText()
+        return "\ufffc" in plain and not plain.replace("\ufffc", "").strip()
+
+    def insertFromMimeData(self, source):
+        if self.prefers_image(source):
             image = source.imageData()
 
-            if isinstance(image, QImage):
+            if isinstance(image, QImage) and not image.isNull():
                 img_dir = os.path.join(APP_DIR, "note_images")
                 os.makedirs(img_dir, exist_ok=True)
 
-                filename = os.path.join(
-                    img_dir,
-                    f"img_{datetime.now().timestamp():.0f}.png"
-                )
-                image.save(filename)
+                filename = os.path.join(img_dir, f"img_{uuid.uuid4().hex}.png")
+
+                # Show the in-memory image right away; encode to disk off the UI thread
+                self.document().addResource(QTextDocument.ImageResource, QUrl(filename), image)
+                QThreadPool.globalInstance().start(lambda: write_png(image, filename))
 
                 display_width = min(image.width(), 600)
                 aspect = image.height() / image.width()
@@ -1456,10 +1930,8 @@ class RichTextEdit(QTextEdit):
                 fmt.setWidth(display_width)
                 fmt.setHeight(display_height)
 
+                # textChanged already routes this through the debounced autosave
                 cursor.insertImage(fmt)
-
-                if self.parent_view:
-                    self.parent_view.on_note_changed()
                 return
 
         # Fallback
@@ -1468,11 +1940,34 @@ class RichTextEdit(QTextEdit):
 # ------------------------- Notes ------------------------- #
 
 class NotesView(QWidget):
+    MAX_HIGHLIGHTS = 500  # matches beyond this are rarely scrolled to
+    MIN_HIGHLIGHT_LEN = 2  # single characters match nearly everywhere
+    BODY_CACHE_SIZE = 20
+
     def __init__(self):
         super().__init__()
 
         self.loading_note = False
         self.search_text = ""
+        self._loaded_note = None  # note dict currently shown in the editor
+        self._editor_dirty = False  # editor text not yet copied into _loaded_note
+        self._hl_key = None  # (pattern, note id, document revision) last highlighted
+        self._pending_highlight = False  # highlight skipped while hidden
+
+        # Autosave is coalesced like TaskManager.save()
+        self._notes_dirty = False
+        self._notes_digest = None
+        self._bodies = OrderedDict()  # note id -> body HTML, least recently used first
+        self._dirty_bodies = set()    # note ids whose body file is out of date
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.flush_notes)
+
+        # Collapse fast typing into one list refresh
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.apply_search)
 
         main_layout = QHBoxLayout(self)
 
@@ -1532,22 +2027,110 @@ class NotesView(QWidget):
 
         # Load notes
         self.notes = self.load_notes()
+        # List items carry the note id, so adding/removing one never reindexes the rest
+        self._by_id = {n["id"]: n for n in self.notes}
+        self._search_index = {n["id"]: self._index_entry(n) for n in self.notes}
         self.refresh_list()
 
     # ---------------- Storage ---------------- #
+    # notes_index.json holds id, title and plain text for the list and search;
+    # each body lives in notes/<id>.json and is only read when opened
 
     def load_notes(self):
-        if not os.path.exists(NOTES_FILE):
-            return []
+        if os.path.exists(NOTES_INDEX_FILE):
+            try:
+                with open(NOTES_INDEX_FILE, "rb") as f:
+                    return json_loads(f.read())
+            except:
+                return []
+        if os.path.exists(NOTES_FILE):
+            return self._migrate_legacy_notes()
+        return []
+
+    def _migrate_legacy_notes(self):
+        """Split the old single notes.json into the index and per-note files."""
         try:
-            with open(NOTES_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(NOTES_FILE, "rb") as f:
+                legacy = json_loads(f.read())
         except:
             return []
 
+        os.makedirs(NOTES_DIR, exist_ok=True)
+        notes = []
+        for old in legacy:
+            body = old.get("body_html", "")
+            note = {
+                "id": uuid.uuid4().hex,
+                "title": old.get("title", "Untitled"),
+                "text": QTextDocumentFragment.fromHtml(body).toPlainText(),
+            }
+            write_file_atomic(self._body_path(note["id"]), self._encode_body(body))
+            notes.append(note)
+
+        write_file_atomic(NOTES_INDEX_FILE, json_dumps(notes))
+        return notes
+
+    @staticmethod
+    def _body_path(note_id):
+        return os.path.join(NOTES_DIR, f"{note_id}.json")
+
+    @staticmethod
+    def _encode_body(body):
+        return json_dumps({"body_html": body})
+
+    def note_body(self, note):
+        """Body HTML of a note, from the LRU cache or its own file."""
+        note_id = note["id"]
+        body = self._bodies.get(note_id)
+        if body is None:
+            try:
+                with open(self._body_path(note_id), "rb") as f:
+                    body = json_loads(f.read()).get("body_html", "")
+            except:
+                body = ""
+        self._cache_body(note_id, body)
+        return body
+
+    def _cache_body(self, note_id, body):
+        self._bodies[note_id] = body
+        self._bodies.move_to_end(note_id)
+
+        # Evict least recently used bodies, but never one not yet written
+        for old_id in list(self._bodies):
+            if len(self._bodies) <= self.BODY_CACHE_SIZE:
+                break
+            if old_id not in self._dirty_bodies:
+                del self._bodies[old_id]
+
     def save_notes(self):
-        with open(NOTES_FILE, "w", encoding="utf-8") as f:
-            json.dump(self.notes, f, indent=4)
+        self._notes_dirty = True
+        self._save_timer.start(500)
+
+    def flush_notes(self):
+        self._save_timer.stop()
+        self._sync_editor()
+        if not self._notes_dirty:
+            return
+
+        if self._dirty_bodies:
+            os.makedirs(NOTES_DIR, exist_ok=True)
+            for note_id in self._dirty_bodies:
+                write_file_atomic(self._body_path(note_id), self._encode_body(self._bodies[note_id]))
+            self._dirty_bodies.clear()
+
+        data = json_dumps(self.notes)
+        digest = hashlib.sha1(data).digest()
+        if digest != self._notes_digest:
+            write_file_atomic(NOTES_INDEX_FILE, data)
+            self._notes_digest = digest
+        self._notes_dirty = False
+
+    # ---------------- Search index ---------------- #
+
+    @staticmethod
+    def _index_entry(note):
+        """Lowercase title + plain-text body; HTML tags are never searched."""
+        return (note.get("title", "Untitled") + " " + note.get("text", "")).lower()
 
     # ---------------- Autosave ---------------- #
 
@@ -1559,35 +2142,61 @@ class NotesView(QWidget):
         if not item:
             return
 
-        idx = item.data(Qt.UserRole)
-
-        self.notes[idx]["title"] = self.title_edit.text().strip()
-        self.notes[idx]["body_html"] = self.text_edit.toHtml()
+        note = self._by_id[item.data(Qt.UserRole)]
+        note["title"] = self.title_edit.text().strip()
+        item.setText(note["title"])
 
-        item.setText(self.notes[idx]["title"])
+        # Serialising the document is O(size); leave it to the autosave
+        self._editor_dirty = True
         self.save_notes()
 
+    def _sync_editor(self):
+        """Copy the editor's body into the loaded note, once per burst of edits."""
+        if not self._editor_dirty:
+            return
+        self._editor_dirty = False
+
+        note = self._loaded_note
+        if note is None:
+            return
+
+        note["text"] = self.text_edit.toPlainText()
+        self._dirty_bodies.add(note["id"])
+        self._cache_body(note["id"], self.text_edit.toHtml())
+        self._search_index[note["id"]] = self._index_entry(note)
+
     # ---------------- Search ---------------- #
 
     def search_notes(self, text):
-        self.search_text = text.strip()
+        self._search_timer.start()
+
+    def apply_search(self):
+        self._sync_editor()
+        self.search_text = self.search_edit.text().strip()
         self.refresh_list()
         self.highlight_text_in_editor(self.search_text)
 
     def highlight_text_in_editor(self, pattern):
-        if not pattern:
-            self.text_edit.setExtraSelections([])
+        # Nothing to see while the Notes page is hidden; showEvent catches up
+        if not self.text_edit.isVisible():
+            self._pending_highlight = True
             return
+        self._pending_highlight = False
 
         doc = self.text_edit.document()
-        cursor = QTextCursor(doc)
+        item = self.notes_list.currentItem()
+        key = (pattern, item.data(Qt.UserRole) if item else None, doc.revision())
+        if key == self._hl_key:
+            return  # same note, same text, same pattern: selections are current
+        self._hl_key = key
 
-        extra = []
-        fmt = QTextCharFormat()
-        fmt.setBackground(QColor("#ffff66"))
+        if len(pattern) < self.MIN_HIGHLIGHT_LEN or doc.isEmpty():
+            self.text_edit.setExtraSelections([])
+            return
 
+        extra = []
         pos = 0
-        while True:
+        while len(extra) < self.MAX_HIGHLIGHTS:
             cursor = doc.find(pattern, pos)
             if cursor.isNull():
                 break
@@ -1595,42 +2204,53 @@ class NotesView(QWidget):
 
             sel = QTextEdit.ExtraSelection()
             sel.cursor = cursor
-            sel.format = fmt
+            sel.format = SEARCH_HIGHLIGHT_FORMAT
             extra.append(sel)
 
         self.text_edit.setExtraSelections(extra)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_highlight:
+            self.highlight_text_in_editor(self.search_text)
+
     # ---------------- List Handling ---------------- #
 
     def refresh_list(self):
         current_item = self.notes_list.currentItem()
-        current_index = current_item.data(Qt.UserRole) if current_item else None
-
-        self.notes_list.clear()
-        visible = []
-
-        for i, note in enumerate(self.notes):
-            title = note.get("title", "Untitled")
-            body = note.get("body_html", "")
-
-            if self.search_text:
-                haystack = (title + " " + body).lower()
-                if self.search_text.lower() not in haystack:
-                    continue
-
-            item = QListWidgetItem(title)
-            item.setData(Qt.UserRole, i)
-            self.notes_list.addItem(item)
-            visible.append(i)
-
-        if current_index in visible:
-            for row in range(self.notes_list.count()):
-                if self.notes_list.item(row).data(Qt.UserRole) == current_index:
-                    self.notes_list.setCurrentRow(row)
-                    break
+        current_id = current_item.data(Qt.UserRole) if current_item else None
+
+        needle = self.search_text.lower()
+        visible = [
+            n for n in self.notes
+            if not needle or needle in self._search_index[n["id"]]
+        ]
+
+        # Repopulate in one pass without per-item repaints or selection signals
+        self.notes_list.setUpdatesEnabled(False)
+        self.notes_list.blockSignals(True)
+        try:
+            self.notes_list.clear()
+            self.notes_list.addItems([n.get("title", "Untitled") for n in visible])
+            restored_row = None
+            for row, n in enumerate(visible):
+                self.notes_list.item(row).setData(Qt.UserRole, n["id"])
+                if n["id"] == current_id:
+                    restored_row = row
+
+            if restored_row is not None:
+                self.notes_list.setCurrentRow(restored_row)
+        finally:
+            self.notes_list.blockSignals(False)
+            self.notes_list.setUpdatesEnabled(True)
+
+        if restored_row is not None:
+            if self._by_id[current_id] is not self._loaded_note:
+                self.load_selected_note(restored_row)
         elif self.notes_list.count() > 0:
             self.notes_list.setCurrentRow(0)
         else:
+            self._loaded_note = None
             self.loading_note = True
             self.title_edit.setText("")
             self.text_edit.setHtml("")
@@ -1639,49 +2259,73 @@ class NotesView(QWidget):
     # ---------------- Note Actions ---------------- #
 
     def create_note(self):
-        self.notes.append({"title": "Untitled", "body_html": ""})
-        self.save_notes()
-        self.refresh_list()
+        note = {"id": uuid.uuid4().hex, "title": "Untitled", "text": ""}
+        self.notes.append(note)
+        self._by_id[note["id"]] = note
+        self._search_index[note["id"]] = self._index_entry(note)
+        self._dirty_bodies.add(note["id"])
+        self._cache_body(note["id"], "")
+
+        item = QListWidgetItem(note["title"])
+        item.setData(Qt.UserRole, note["id"])
+        self.notes_list.addItem(item)
         self.notes_list.setCurrentRow(self.notes_list.count() - 1)
+        self.save_notes()
 
     def load_selected_note(self, index):
+        self._sync_editor()
         item = self.notes_list.item(index)
         if not item:
+            self._loaded_note = None
             self.loading_note = True
             self.title_edit.setText("")
             self.text_edit.setHtml("")
             self.loading_note = False
             return
 
-        idx = item.data(Qt.UserRole)
-        note = self.notes[idx]
+        note = self._by_id[item.data(Qt.UserRole)]
+        self._loaded_note = note
 
         self.loading_note = True
         self.title_edit.setText(note.get("title", "Untitled"))
-        self.text_edit.setHtml(note.get("body_html", ""))
+        self.text_edit.setHtml(self.note_body(note))
         self.loading_note = False
 
-        self.highlight_text_in_editor(self.search_text)
+        # Highlight after the note is shown, not while switching to it
+        QTimer.singleShot(0, lambda: self.highlight_text_in_editor(self.search_text))
 
     def delete_current_note(self):
         item = self.notes_list.currentItem()
         if not item:
             return
 
-        idx = item.data(Qt.UserRole)
-        del self.notes[idx]
+        note = self._by_id.pop(item.data(Qt.UserRole))
+        self.notes.remove(note)
+        del self._search_index[note["id"]]
+        if note is self._loaded_note:
+            self._editor_dirty = False
+
+        self._bodies.pop(note["id"], None)
+        self._dirty_bodies.discard(note["id"])
+        try:
+            os.remove(self._body_path(note["id"]))
+        except OSError:
+            pass
         self.save_notes()
-        self.refresh_list()
+
+        # Removing the row moves the selection on and loads the neighbouring note
+        self.notes_list.takeItem(self.notes_list.row(item))
 
     # ---------------- Image insertion ---------------- #
 
     def insert_image_from_path(self, path):
-        image = QImage(path)
-        if image.isNull():
+        # Header-only read; the editor decodes the image itself for display
+        size = QImageReader(path).size()
+        if not size.isValid() or size.width() <= 0:
             return
 
-        display_width = min(image.width(), 600)
-        aspect = image.height() / image.width()
+        display_width = min(size.width(), 600)
+        aspect = size.height() / size.width()
         display_height = int(display_width * aspect)
 
         cursor = self.text_edit.textCursor()
@@ -1714,11 +2358,15 @@ class NotesView(QWidget):
         img_fmt = QTextImageFormat(fmt)
         path = img_fmt.name()
 
-        image = QImage(path)
-        if image.isNull():
-            return
+        # Aspect ratio from the inserted size; fall back to the file header
+        width, height = img_fmt.width(), img_fmt.height()
+        if width <= 0 or height <= 0:
+            size = QImageReader(path).size()
+            if not size.isValid() or size.width() <= 0:
+                return
+            width, height = size.width(), size.height()
 
-        dlg = ImageResizeDialog(img_fmt.width(), self)
+        dlg = ImageResizeDialog(width, self)
         if dlg.exec() != QDialog.Accepted:
             return
 
@@ -1726,7 +2374,7 @@ class NotesView(QWidget):
         if not new_width or new_width <= 0:
             return
 
-        aspect = image.height() / image.width()
+        aspect = height / width
         new_height = int(new_width * aspect)
 
         new_fmt = QTextImageFormat()
@@ -1763,6 +2411,51 @@ class NotesView(QWidget):
 # ---------------------- Topic Model ---------------------- #
 
 class Topic:
+    # Persisted fields; assigning any of them drops the cached to_dict()
+    FIELDS = frozenset({
+        "question",
+        "asked_to",
+        "asked_at",
+        "deadline",
+        "status",
+        "category",
+        "priority",
+        "channel",
+        "reminder_date",
+        "answer",
+        "history",
+        "answered_at",
+    })
+    # Fields the topics filter matches on; assigning one drops the lowered copies
+    FILTER_FIELDS = frozenset({
+        "question",
+        "answer",
+        "category",
+        "asked_to",
+        "status",
+        "priority",
+    })
+    # ISO date fields shown as dd.MM.yyyy; assigning one drops its cached text
+    DATE_FIELDS = frozenset({"asked_at", "deadline", "reminder_date"})
+
+    __slots__ = (
+        "question",
+        "asked_to",
+        "asked_at",
+        "deadline",
+        "status",
+        "category",
+        "priority",
+        "channel",
+        "reminder_date",
+        "answer",
+        "history",
+        "answered_at",
+        "_dict_cache",
+        "_filter_keys",
+        "_date_texts",
+    )
+
     def __init__(
         self,
         question="",
@@ -1778,6 +2471,9 @@ class Topic:
         history="",
         answered_at=None,
     ):
+        self._dict_cache = None
+        self._filter_keys = None
+        self._date_texts = {}
         self.question = question
         self.asked_to = asked_to
         self.asked_at = asked_at
@@ -1791,21 +2487,54 @@ class Topic:
         self.history = history
         self.answered_at = answered_at
 
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in Topic.FIELDS:
+            object.__setattr__(self, "_dict_cache", None)
+            if name in Topic.FILTER_FIELDS:
+                object.__setattr__(self, "_filter_keys", None)
+            elif name in Topic.DATE_FIELDS:
+                self._date_texts.pop(name, None)
+
+    def date_text(self, field):
+        """A date field formatted for the table; raw text if it does not parse."""
+        text = self._date_texts.get(field)
+        if text is None:
+            iso = getattr(self, field)
+            text = (format_iso_date(iso) or iso) if iso else ""
+            self._date_texts[field] = text
+        return text
+
+    @property
+    def filter_keys(self):
+        """Lower-cased (status, priority, category, asked_to, question+answer)."""
+        if self._filter_keys is None:
+            self._filter_keys = (
+                (self.status or "").lower(),
+                (self.priority or "").lower(),
+                (self.category or "").lower(),
+                (self.asked_to or "").lower(),
+                f"{self.question} {self.answer}".lower(),
+            )
+        return self._filter_keys
+
     def to_dict(self):
-        return {
-            "question": self.question or "",
-            "asked_to": self.asked_to or "",
-            "asked_at": self.asked_at,
-            "deadline": self.deadline,
-            "status": self.status,
-            "category": self.category,
-            "priority": self.priority,
-            "channel": self.channel,
-            "reminder_date": self.reminder_date,
-            "answer": self.answer,
-            "history": self.history,
-            "answered_at": self.answered_at,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "question": self.question or "",
+                "asked_to": self.asked_to or "",
+                "asked_at": self.asked_at,
+                "deadline": self.deadline,
+                "status": self.status,
+                "category": self.category,
+                "priority": self.priority,
+                "channel": self.channel,
+                "reminder_date": self.reminder_date,
+                "answer": self.answer,
+                "history": self.history,
+                "answered_at": self.answered_at,
+            }
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, d):
@@ -1829,13 +2558,24 @@ class Topic:
 class TopicManager:
     def __init__(self):
         self.topics: list[Topic] = []
+
+        # Writes are coalesced like TaskManager.save(), then done off the GUI thread
+        self._dirty = False
+        self._last_digest = None
+        self._pending = None  # newest serialized bytes not yet on disk
+        self._pending_lock = threading.Lock()  # only around _pending swaps
+        self._write_lock = threading.Lock()  # held by the pool job while writing
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.flush)
+
         self.load()
 
     def load(self):
         try:
             if os.path.exists(TOPICS_FILE):
-                with open(TOPICS_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(TOPICS_FILE, "rb") as f:
+                    data = json_loads(f.read())
                 self.topics = [Topic.from_dict(t) for t in data]
             else:
                 self.topics = []
@@ -1843,11 +2583,52 @@ class TopicManager:
             self.topics = []
 
     def save(self):
+        self._dirty = True
+        self._save_timer.start(500)
+
+    def flush(self):
+        self._save_timer.stop()
+        if not self._dirty:
+            return
+
         try:
-            with open(TOPICS_FILE, "w", encoding="utf-8") as f:
-                json.dump([t.to_dict() for t in self.topics], f, indent=2)
+            data = json_dumps([t.to_dict() for t in self.topics])
         except Exception as e:
             print("ERROR saving topics:", e)
+            return
+
+        self._dirty = False
+        digest = hashlib.sha1(data).digest()
+        # Digest and pending bytes change together, so a failing job's reset
+        # below can never be overwritten by a stale digest
+        with self._pending_lock:
+            if digest == self._last_digest:
+                return
+            self._last_digest = digest
+            self._pending = data
+        QThreadPool.globalInstance().start(self._write_pending)
+
+    def _write_pending(self):
+        # Pool thread; each job writes the newest bytes, so writes never land
+        # out of order. The GUI thread never takes _write_lock, so it never
+        # waits on disk IO.
+        with self._write_lock:
+            with self._pending_lock:
+                data, self._pending = self._pending, None
+            if data is None:
+                return
+            try:
+                write_file_atomic(TOPICS_FILE, data)
+            except Exception as e:
+                print("ERROR saving topics:", e)
+                # Forget the digest and retry in a few seconds (or on quit);
+                # the timer lives on the GUI thread, so start it queued
+                with self._pending_lock:
+                    self._last_digest = None
+                    self._dirty = True
+                QMetaObject.invokeMethod(
+                    self._save_timer, "start", Qt.QueuedConnection, Q_ARG(int, 5000)
+                )
 
     def add_topic(self, topic: Topic):
         self.topics.append(topic)
@@ -1864,54 +2645,53 @@ class TopicManager:
 # ---------------------- Topic Dialog ---------------------- #
 
 class TopicDialog(QDialog):
+    """Built once per TopicsView and reused; load_topic() swaps in the topic."""
+
+    DATE_FORMAT = "dd.MM.yyyy"
+
     def __init__(self, manager: TopicManager, topic=None, parent=None):
         super().__init__(parent)
         self.manager = manager
-        self.topic = topic
-        self.setWindowTitle("Edit Topic" if topic else "New Topic")
+        self.topic = None
         self.setMinimumWidth(520)
         self.init_ui()
+        self.load_topic(topic)
 
     # ---------------------- DATE PICKER ---------------------- #
-    def make_date_picker(self, initial=None):
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
+    @staticmethod
+    def iso_to_qdate(iso):
+        """Date part of an ISO stamp; invalid QDate if missing or unparsable."""
+        return QDate.fromString(iso[:10], "yyyy-MM-dd") if iso else QDate()
 
+    def make_date_picker(self, initial=None):
+        # A bare QDateEdit: its popup calendar is only built when first opened
         edit = QDateEdit()
-        edit.setDisplayFormat("dd.MM.yyyy")
+        edit.setDisplayFormat(self.DATE_FORMAT)
         edit.setCalendarPopup(True)
         edit.setMinimumHeight(28)
 
-        if initial:
-            try:
-                dt = datetime.fromisoformat(initial)
-                edit.setDate(QDate(dt.year, dt.month, dt.day))
-            except Exception:
-                edit.setDate(QDate.currentDate())
-        else:
-            edit.setDate(QDate.currentDate())
-
-        layout.addWidget(edit)
-        return container, edit
+        date = self.iso_to_qdate(initial)
+        edit.setDate(date if date.isValid() else QDate.currentDate())
+        return edit
 
     # ---------------------- UI SETUP ---------------------- #
     def init_ui(self):
         layout = QVBoxLayout(self)
         form = QFormLayout()
 
-        self.question_edit = QTextEdit()
+        # Plain-text editors: these fields never hold rich text
+        self.question_edit = QPlainTextEdit()
         self.question_edit.setFixedHeight(60)
         form.addRow("Question:", self.question_edit)
 
         self.asked_to_edit = QLineEdit()
         form.addRow("Asked to:", self.asked_to_edit)
 
-        self.asked_at_container, self.asked_at_edit = self.make_date_picker()
-        form.addRow("Asked at:", self.asked_at_container)
+        self.asked_at_edit = self.make_date_picker()
+        form.addRow("Asked at:", self.asked_at_edit)
 
-        self.deadline_container, self.deadline_edit = self.make_date_picker()
-        form.addRow("Deadline:", self.deadline_container)
+        self.deadline_edit = self.make_date_picker()
+        form.addRow("Deadline:", self.deadline_edit)
 
         self.status_combo = QComboBox()
         self.status_combo.addItems(["open", "waiting", "blocked", "answered"])
@@ -1927,14 +2707,14 @@ class TopicDialog(QDialog):
         self.channel_edit = QLineEdit()
         form.addRow("Channel:", self.channel_edit)
 
-        self.reminder_container, self.reminder_edit = self.make_date_picker()
-        form.addRow("Reminder:", self.reminder_container)
+        self.reminder_edit = self.make_date_picker()
+        form.addRow("Reminder:", self.reminder_edit)
 
-        self.answer_edit = QTextEdit()
+        self.answer_edit = QPlainTextEdit()
         self.answer_edit.setFixedHeight(80)
         form.addRow("Answer:", self.answer_edit)
 
-        self.history_edit = QTextEdit()
+        self.history_edit = QPlainTextEdit()
         self.history_edit.setFixedHeight(80)
         form.addRow("History:", self.history_edit)
 
@@ -1951,33 +2731,54 @@ class TopicDialog(QDialog):
         btns.addWidget(cancel_btn)
         layout.addLayout(btns)
 
-        if self.topic:
-            self.load_topic()
-
     # ---------------------- LOAD ---------------------- #
-    def load_topic(self):
-        t = self.topic
-        self.question_edit.setPlainText(t.question)
-        self.asked_to_edit.setText(t.asked_to)
+    def load_topic(self, topic=None):
+        """Fill the form from topic, or reset it for a new one."""
+        self.topic = topic
+        self.setWindowTitle("Edit Topic" if topic else "New Topic")
+        t = topic or Topic()
+
+        # Only touch widgets whose value differs; re-setting a text editor
+        # rebuilds its whole document
+        def set_plain(edit, text):
+            text = text or ""
+            if edit.toPlainText() != text:
+                edit.setPlainText(text)
+
+        def set_text(edit, text):
+            text = text or ""
+            if edit.text() != text:
+                edit.setText(text)
+
+        def set_combo(combo, text):
+            # Unknown values fall back to the first item, as in a fresh dialog
+            idx = combo.findText(text or "")
+            if idx < 0:
+                idx = 0
+            if combo.currentIndex() != idx:
+                combo.setCurrentIndex(idx)
 
         def set_date(widget, iso):
-            if iso:
-                try:
-                    dt = datetime.fromisoformat(iso)
-                    widget.setDate(QDate(dt.year, dt.month, dt.day))
-                except:
-                    pass
+            date = self.iso_to_qdate(iso)
+            if not date.isValid():
+                date = QDate.currentDate()
+            if widget.date() != date:
+                widget.setDate(date)
+
+        set_plain(self.question_edit, t.question)
+        set_text(self.asked_to_edit, t.asked_to)
 
         set_date(self.asked_at_edit, t.asked_at)
         set_date(self.deadline_edit, t.deadline)
         set_date(self.reminder_edit, t.reminder_date)
 
-        self.status_combo.setCurrentText(t.status)
-        self.category_edit.setText(t.category)
-        self.priority_combo.setCurrentText(t.priority)
-        self.channel_edit.setText(t.channel)
-        self.answer_edit.setPlainText(t.answer)
-        self.history_edit.setPlainText(t.history)
+        set_combo(self.status_combo, t.status)
+        set_text(self.category_edit, t.category)
+        set_combo(self.priority_combo, t.priority)
+        set_text(self.channel_edit, t.channel)
+        set_plain(self.answer_edit, t.answer)
+        set_plain(self.history_edit, t.history)
+        self.question_edit.setFocus()
 
     # ---------------------- SAVE ---------------------- #
     def save_and_close(self):
@@ -2050,11 +2851,28 @@ class TopicTableModel(QAbstractTableModel):
         "Reminder",
         "Answer",
     ]
+    # Fixed starting widths; measuring contents would walk every cell
+    COLUMN_WIDTHS = (300, 110, 90, 90, 80, 110, 70, 90, 90)
+
+    # One getter per column: data() runs per visible cell, so it must not
+    # format the other nine fields each time
+    COLUMN_TEXT = (
+        lambda t: t.question,
+        lambda t: t.asked_to,
+        lambda t: t.date_text("asked_at"),
+        lambda t: t.date_text("deadline"),
+        lambda t: t.status,
+        lambda t: t.category,
+        lambda t: t.priority,
+        lambda t: t.channel,
+        lambda t: t.date_text("reminder_date"),
+        lambda t: t.answer,
+    )
 
     def __init__(self, manager):
         super().__init__()
         self.manager = manager
-        self.topics = manager.all_topics()
+        self.topics = list(manager.all_topics())  # snapshot: rows change only via refresh()
 
     def rowCount(self, parent=None):
         return len(self.topics)
@@ -2072,29 +2890,7 @@ class TopicTableModel(QAbstractTableModel):
             return topic
 
         if role == Qt.DisplayRole:
-            def fmt(d):
-                if not d:
-                    return ""
-                try:
-                    dt = datetime.fromisoformat(d)
-                    return dt.strftime("%d.%m.%Y")
-                except:
-                    return d
-
-            col = index.column()
-            mapping = [
-                topic.question,
-                topic.asked_to,
-                fmt(topic.asked_at),
-                fmt(topic.deadline),
-                topic.status,
-                topic.category,
-                topic.priority,
-                topic.channel,
-                fmt(topic.reminder_date),
-                topic.answer,
-            ]
-            return mapping[col]
+            return self.COLUMN_TEXT[index.column()](topic)
 
         return None
 
@@ -2103,8 +2899,22 @@ class TopicTableModel(QAbstractTableModel):
             return self.HEADERS[s]
 
     def refresh(self):
+        topics = self.manager.all_topics()
+
+        # Same topics as shown (an edit): update the cells in place instead of
+        # resetting, so the proxy only re-sorts/re-filters changed rows
+        if len(topics) == len(self.topics) and all(
+            a is b for a, b in zip(topics, self.topics)
+        ):
+            if topics:
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(len(topics) - 1, self.columnCount() - 1),
+                )
+            return
+
         self.beginResetModel()
-        self.topics = self.manager.all_topics()
+        self.topics = list(topics)
         self.endResetModel()
 
 # ---------------------- Filter Proxy ---------------------- #
@@ -2117,6 +2927,7 @@ class TopicSortFilterProxyModel(QSortFilterProxyModel):
         self.priority = "all"
         self.person = ""
         self.search = ""
+        self.active = False
 
     def setFilters(self, status, category, priority, person, search):
         self.status = status.lower()
@@ -2124,27 +2935,32 @@ class TopicSortFilterProxyModel(QSortFilterProxyModel):
         self.priority = priority.lower()
         self.person = person.lower()
         self.search = search.lower()
+        self.active = (
+            self.status != "all" or self.priority != "all"
+            or bool(self.category or self.person or self.search)
+        )
         self.invalidateFilter()
 
     def filterAcceptsRow(self, row, parent):
-        model = self.sourceModel()
-        topic = model.data(model.index(row, 0), Qt.UserRole)
-        if not topic:
-            return False
+        if not self.active:
+            return True
+
+        # Exact status/priority compares first, substring tests last
+        topic = self.sourceModel().topics[row]
+        status, priority, category, person, haystack = topic.filter_keys
 
-        if self.status != "all" and topic.status.lower() != self.status:
+        if self.status != "all" and status != self.status:
             return False
 
-        if self.priority != "all" and topic.priority.lower() != self.priority:
+        if self.priority != "all" and priority != self.priority:
             return False
 
-        if self.category and self.category not in (topic.category or "").lower():
+        if self.category and self.category not in category:
             return False
 
-        if self.person and self.person not in (topic.asked_to or "").lower():
+        if self.person and self.person not in person:
             return False
 
-        haystack = f"{topic.question} {topic.answer}".lower()
         if self.search and self.search not in haystack:
             return False
 
@@ -2160,6 +2976,7 @@ class TopicsView(QWidget):
         self.model = TopicTableModel(manager)
         self.proxy = TopicSortFilterProxyModel()
         self.proxy.setSourceModel(self.model)
+        self._dialog = None  # TopicDialog, built on first use
 
         self.init_ui()
 
@@ -2202,6 +3019,16 @@ class TopicsView(QWidget):
         apply_btn = QPushButton("Filter")
         apply_btn.clicked.connect(self.apply_filters)
 
+        # Filter as you type, one pass per pause rather than per keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.apply_filters)
+        for edit in (self.category, self.person, self.search):
+            edit.textChanged.connect(self.schedule_filters)
+        for combo in (self.status, self.priority):
+            combo.currentIndexChanged.connect(self.schedule_filters)
+
         for w in [
             QLabel("Status:"), self.status,
             QLabel("Category:"), self.category,
@@ -2221,10 +3048,21 @@ class TopicsView(QWidget):
         self.table.setSelectionMode(QTableView.SingleSelection)
         self.table.setSortingEnabled(True)
         self.table.doubleClicked.connect(self.edit_topic)
+
+        header = self.table.horizontalHeader()
+        for col, width in enumerate(TopicTableModel.COLUMN_WIDTHS):
+            header.resizeSection(col, width)
+        header.setStretchLastSection(True)  # Answer takes the remaining space
         layout.addWidget(self.table)
 
     # Buttons
+    def schedule_filters(self, *_):
+        # Not timer.start directly: the start(int) overload would take the
+        # signal argument as the new interval
+        self._filter_timer.start()
+
     def apply_filters(self):
+        self._filter_timer.stop()
         self.proxy.setFilters(
             self.status.currentText(),
             self.category.text(),
@@ -2234,28 +3072,31 @@ class TopicsView(QWidget):
         )
 
     def refresh(self):
+        # The source reset already rebuilds the proxy's mapping and sort
         self.model.refresh()
-        self.proxy.invalidate()
         self.table.clearSelection()
 
     def get_selected_topic(self):
         idx = self.table.currentIndex()
         if not idx.isValid():
             return None
-        src = self.proxy.mapToSource(idx)
-        return self.model.data(self.model.index(src.row(), 0), Qt.UserRole)
+        return self.model.topics[self.proxy.mapToSource(idx).row()]
+
+    def topic_dialog(self, topic):
+        if self._dialog is None:
+            self._dialog = TopicDialog(self.manager, parent=self)
+        self._dialog.load_topic(topic)
+        return self._dialog
 
     def new_topic(self):
-        dlg = TopicDialog(self.manager, None, self)
-        if dlg.exec():
+        if self.topic_dialog(None).exec():
             self.refresh()
 
     def edit_topic(self):
         t = self.get_selected_topic()
         if not t:
             return
-        dlg = TopicDialog(self.manager, t, self)
-        if dlg.exec():
+        if self.topic_dialog(t).exec():
             self.refresh()
 
     def delete_topic(self):
@@ -2282,21 +3123,19 @@ class MainWindow(QMainWindow):
         self.stack = QStackedWidget()
 
         # --- Views --- #
-        self.matrix_view = MatrixView(self.manager, self.refresh_all_views)
-        self.timeline_view = TimelineView(self.manager, self.refresh_all_views)
-        self.archive_view = ArchiveView(self.manager)
-        self.stats_view = StatisticsView(self.manager)
-        self.notes_view = NotesView()
-        self.topics_view = TopicsView(self.topic_manager)   
-
-        self.stack.addWidget(self.matrix_view)     # index 0
-        self.stack.addWidget(self.timeline_view)   # index 1
-        self.stack.addWidget(self.archive_view)    # index 2
-        self.stack.addWidget(self.stats_view)      # index 3
-        self.stack.addWidget(self.notes_view)      # index 4
-        self.stack.addWidget(self.topics_view)     # index 5   
+        # Built on first navigation; each view populates itself when created
+        self._view_factories = {
+            "matrix": lambda: MatrixView(self.manager, self.refresh_task_views),
+            "timeline": lambda: TimelineView(self.manager, self.refresh_task_views),
+            "archive": lambda: ArchiveView(self.manager),
+            "stats": lambda: StatisticsView(self.manager),
+            "notes": NotesView,
+            "topics": lambda: TopicsView(self.topic_manager),
+        }
+        self._views = {}
 
         self.setCentralWidget(self.stack)
+        self.show_view("matrix")
 
         # ---------------- Toolbar ---------------- #
         toolbar = QToolBar("Navigation")
@@ -2310,39 +3149,63 @@ class MainWindow(QMainWindow):
         toolbar.addSeparator()
 
         # Navigation buttons
-        def add_nav_action(text, index):
+        def add_nav_action(text, name):
             act = QAction(text, self)
-            act.triggered.connect(lambda _, i=index: self.stack.setCurrentIndex(i))
+            act.triggered.connect(lambda _, n=name: self.show_view(n))
             toolbar.addAction(act)
 
-        add_nav_action("Matrix", 0)
-        add_nav_action("Timeline", 1)
-        add_nav_action("Archive", 2)
-        add_nav_action("Statistics", 3)
-        add_nav_action("Notes", 4)
-        add_nav_action("Topics", 5)   
+        add_nav_action("Matrix", "matrix")
+        add_nav_action("Timeline", "timeline")
+        add_nav_action("Archive", "archive")
+        add_nav_action("Statistics", "stats")
+        add_nav_action("Notes", "notes")
+        add_nav_action("Topics", "topics")
 
         self.statusBar().showMessage("Ready")
-        self.refresh_all_views()
+
+    def view(self, name):
+        """The named view, built and added to the stack on first use."""
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = self._view_factories[name]()
+            self.stack.addWidget(view)
+        return view
+
+    def show_view(self, name):
+        self.stack.setCurrentWidget(self.view(name))
 
     def open_create_task_dialog(self):
         dlg = CreateTaskDialog(self.manager, self)
         if dlg.exec():
-            self.refresh_all_views()
-
-    def refresh_all_views(self):
-        self.matrix_view.refresh()
-        self.timeline_view.refresh()
-        self.archive_view.refresh()
-        self.stats_view.refresh()
-        self.topics_view.refresh()     
+            self.refresh_task_views()
+
+    def refresh_task_views(self):
+        # Task edits never touch topics; TopicsView refreshes itself.
+        # Views not built yet will read fresh data when they are.
+        for name in ("matrix", "timeline", "archive", "stats"):
+            view = self._views.get(name)
+            if view is not None:
+                view.refresh()
         self.manager.save()
-        self.topic_manager.save()      
+
+    def flush_all(self):
+        """Write out every pending debounced save right now."""
+        self.manager.flush()
+        self.topic_manager.flush()
+        notes = self._views.get("notes")
+        if notes is not None:
+            notes.flush_notes()
+        QThreadPool.globalInstance().waitForDone()  # pending pasted-image writes
+
+    def closeEvent(self, event):
+        self.flush_all()
+        super().closeEvent(event)
 
 # ---------------------- Entry point ---------------------- #
 
 def main():
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(10240)  # KB; rendered task rows
 
     palette = app.palette()
     palette.setColor(QPalette.Base, QColor("#ffffff"))
@@ -2435,6 +3298,7 @@ def main():
     """)
 
     window = MainWindow()
+    app.aboutToQuit.connect(window.flush_all)  # also covers quits that skip closeEvent
     window.show()
     sys.exit(app.exec())
 